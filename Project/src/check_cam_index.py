@@ -1,4 +1,5 @@
 import cv2
+import argparse
 
 def test_cameras():
     print("Testing Camera Indices 0 to 10...")
@@ -23,4 +24,12 @@ def test_cameras():
             print(f"[FAIL] No camera at Index {index}")
 
 if __name__ == "__main__":
-    test_cameras()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Find the camera index for WEBCAM_INDEX / --source")
+    parser.add_argument('-n', '--no-preview', action='store_true',
+                        help='Non-interactive: probe indices 0-10 and print the negotiated mode of each')
+    args = parser.parse_args()
+    if args.no_preview:
+        from conway_framesource import probe_devices
+        probe_devices()
+    else:
+        test_cameras()
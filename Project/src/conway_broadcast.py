@@ -0,0 +1,437 @@
+import sys
+import time
+import multiprocessing
+import numpy as np
+from multiprocessing import shared_memory
+from conway_config import *
+
+# --- SHARED MEMORY LAYOUT ---
+# [ global header | slot 0 | slot 1 | ... | slot N-1 ]
+# Global header (int64): see H_* indices below.
+# Slot = slot header (int64, see S_* indices) + payload bytes.
+#   KEYFRAME payload: occupancy (u1) | color index (u1) | stability (u4), each WIDTH*HEIGHT, indexed [x, y]
+#   DELTA payload:    upserts (i4 x 4: x, y, color, stability) | deaths (i4 x 2: x, y)
+# On a DELTA with "stepped" set, every live cell that is not upserted ages by one (stability + 1),
+# which is exactly what update_game_logic does to survivors.
+
+MAGIC = 0x434F4E57  # "CONW"
+
+H_MAGIC, H_WIDTH, H_HEIGHT, H_SLOTS, H_SLOT_SIZE, H_LATEST, H_LATEST_KEY, H_WORKING, H_CLOSED, H_HEARTBEAT = range(10)
+HEADER_FIELDS = 16
+
+S_SEQ, S_INDEX, S_GENERATION, S_KIND, S_STEPPED, S_UPSERTS, S_DEATHS = range(7)
+SLOT_FIELDS = 8
+
+KIND_KEY = 0
+KIND_DELTA = 1
+
+
+def _slot_payload_size(width, height):
+    return width * height * (1 + 1 + 4)
+
+
+def _untrack(shm):
+    """
+    Attaching registers the block with the resource tracker (still the default in 3.13+, track=True),
+    which would unlink the server's block when this process exits.
+    Children started by multiprocessing share their parent's tracker, so leave theirs alone.
+    """
+    if sys.platform != "win32" and multiprocessing.parent_process() is None:
+        try:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, "shared_memory")
+        except Exception:
+            pass
+
+
+def _is_stale(shm):
+    """True if the block was never initialized, was closed, or its server stopped publishing."""
+    if shm.size < HEADER_FIELDS * 8:
+        return True
+    header = np.ndarray((HEADER_FIELDS,), dtype=np.int64, buffer=shm.buf)
+    try:
+        if header[H_MAGIC] != MAGIC or header[H_CLOSED]:
+            return True
+        # A live server bumps the heartbeat every main-loop frame, paused or not
+        beat = int(header[H_HEARTBEAT])
+        time.sleep(BROADCAST_STALE_S)
+        return int(header[H_HEARTBEAT]) == beat
+    finally:
+        del header
+
+
+class _BoardRing:
+    """Numpy views over the shared memory block (shared by publisher and subscriber)."""
+
+    def _map(self):
+        self.header = np.ndarray((HEADER_FIELDS,), dtype=np.int64, buffer=self.shm.buf)
+        self.width = int(self.header[H_WIDTH])
+        self.height = int(self.header[H_HEIGHT])
+        self.slot_count = int(self.header[H_SLOTS])
+        self.slot_size = int(self.header[H_SLOT_SIZE])
+        self.payload_size = self.slot_size - SLOT_FIELDS * 8
+
+    def _slot_offset(self, slot):
+        return HEADER_FIELDS * 8 + slot * self.slot_size
+
+    def _slot_header(self, slot):
+        return np.ndarray((SLOT_FIELDS,), dtype=np.int64, buffer=self.shm.buf, offset=self._slot_offset(slot))
+
+    def _slot_payload(self, slot):
+        return np.ndarray((self.payload_size,), dtype=np.uint8, buffer=self.shm.buf,
+                          offset=self._slot_offset(slot) + SLOT_FIELDS * 8)
+
+
+class BoardPublisher(_BoardRing):
+    """
+    Single writer. Publishes the board after every change as a delta frame,
+    with a full keyframe every `keyframe_interval` frames (or when the delta would not fit).
+    """
+
+    def __init__(self, name, width, height, slot_count=BROADCAST_RING_SLOTS, keyframe_interval=BROADCAST_KEYFRAME_INTERVAL):
+        # Viewers that fall behind resync from the latest keyframe, so it must still be in the ring
+        if slot_count < 2 * keyframe_interval:
+            raise ValueError("slot_count must be at least twice keyframe_interval")
+
+        slot_size = SLOT_FIELDS * 8 + _slot_payload_size(width, height)
+        size = HEADER_FIELDS * 8 + slot_count * slot_size
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            # Only take the name over from a server that is gone, never from a live one
+            existing = shared_memory.SharedMemory(name=name)
+            if not _is_stale(existing):
+                _untrack(existing)
+                existing.close()
+                raise FileExistsError(f"A board server named '{name}' is already running; pick another name with -s NAME")
+            existing.close(); existing.unlink()
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+
+        header = np.ndarray((HEADER_FIELDS,), dtype=np.int64, buffer=self.shm.buf)
+        header[:] = 0
+        header[H_WIDTH] = width
+        header[H_HEIGHT] = height
+        header[H_SLOTS] = slot_count
+        header[H_SLOT_SIZE] = slot_size
+        header[H_LATEST] = -1
+        header[H_LATEST_KEY] = -1
+        header[H_MAGIC] = MAGIC  # written last: viewers wait for it
+        self._map()
+
+        self.name = name
+        self.keyframe_interval = keyframe_interval
+        self.frame_index = -1
+        self.generation = -1
+        self.prev_cells = {}
+
+        # Stats
+        self.keyframes = 0
+        self.deltas = 0
+        self.bytes_written = 0
+
+    def publish(self, params):
+        """Publishes the current board if it changed. Returns True if a frame was written."""
+        self.header[H_WORKING] = int(params.working)
+        self.header[H_HEARTBEAT] += 1  # proves we are alive even when nothing changes
+        stepped = params.generation != self.generation
+        if not stepped and self.frame_index >= 0 and params.live_cells == self.prev_cells:
+            return False
+
+        index = self.frame_index + 1
+        slot = index % self.slot_count
+        hdr = self._slot_header(slot)
+        payload = self._slot_payload(slot)
+
+        # Seqlock: odd = being written, readers discard the slot
+        hdr[S_SEQ] += 1
+
+        written = None
+        if index % self.keyframe_interval != 0:
+            written = self._write_delta(hdr, payload, params, stepped)
+        if written is None:
+            written = self._write_key(hdr, payload, params)
+
+        hdr[S_INDEX] = index
+        hdr[S_GENERATION] = params.generation
+        hdr[S_SEQ] += 1
+
+        if hdr[S_KIND] == KIND_KEY:
+            self.header[H_LATEST_KEY] = index
+        self.header[H_LATEST] = index
+
+        self.frame_index = index
+        self.generation = params.generation
+        self.prev_cells = params.live_cells.copy()
+        self.bytes_written += written
+        return True
+
+    def _in_bounds(self, cell):
+        return 0 <= cell[0] < self.width and 0 <= cell[1] < self.height
+
+    def _write_key(self, hdr, payload, params):
+        n = self.width * self.height
+        occupancy = payload[:n].reshape(self.width, self.height)
+        color = payload[n:2 * n].reshape(self.width, self.height)
+        stability = payload[2 * n:6 * n].view(np.uint32).reshape(self.width, self.height)
+        occupancy[:] = 0; color[:] = 0; stability[:] = 0
+
+        cells = [c for c in params.live_cells if self._in_bounds(c)]
+        if cells:
+            xs, ys = np.array(cells, dtype=np.intp).T
+            occupancy[xs, ys] = 1
+            color[xs, ys] = [params.live_cells[c] for c in cells]
+            stability[xs, ys] = [params.cell_stability.get(c, 0) for c in cells]
+
+        hdr[S_KIND] = KIND_KEY
+        hdr[S_STEPPED] = 0
+        hdr[S_UPSERTS] = 0
+        hdr[S_DEATHS] = 0
+        self.keyframes += 1
+        return 6 * n
+
+    def _write_delta(self, hdr, payload, params, stepped):
+        # 1. Diff against the last published board
+        prev = self.prev_cells
+        upserts = [(x, y, c, params.cell_stability.get((x, y), 0))
+                   for (x, y), c in params.live_cells.items()
+                   if prev.get((x, y)) != c and self._in_bounds((x, y))]
+        deaths = [cell for cell in prev if cell not in params.live_cells and self._in_bounds(cell)]
+
+        # 2. Fall back to a keyframe if it does not fit
+        size = len(upserts) * 16 + len(deaths) * 8
+        if size > self.payload_size:
+            return None
+
+        if upserts:
+            payload[:len(upserts) * 16].view(np.int32).reshape(-1, 4)[:] = upserts
+        if deaths:
+            payload[len(upserts) * 16:size].view(np.int32).reshape(-1, 2)[:] = deaths
+
+        hdr[S_KIND] = KIND_DELTA
+        hdr[S_STEPPED] = int(stepped)
+        hdr[S_UPSERTS] = len(upserts)
+        hdr[S_DEATHS] = len(deaths)
+        self.deltas += 1
+        return size
+
+    def close(self):
+        if self.shm is None:
+            return
+        self.header[H_CLOSED] = 1
+        del self.header
+        self.shm.close()
+        self.shm.unlink()
+        self.shm = None
+
+
+class BoardSubscriber(_BoardRing):
+    """
+    Any number of readers. Each keeps its own copy of the board and calls poll()
+    at its own rate; if it falls behind it jumps to the latest keyframe.
+    """
+
+    def __init__(self, name, timeout=5.0):
+        deadline = time.time() + timeout
+        while True:
+            try:
+                self.shm = shared_memory.SharedMemory(name=name)
+                if self.shm.size >= HEADER_FIELDS * 8 and np.ndarray((1,), dtype=np.int64, buffer=self.shm.buf)[0] == MAGIC:
+                    break
+                self.shm.close()
+            except FileNotFoundError:
+                pass
+            if time.time() > deadline:
+                raise FileNotFoundError(f"No board server named '{name}'")
+            time.sleep(0.05)
+
+        _untrack(self.shm)
+
+        self._map()
+        self.occupancy = np.zeros((self.width, self.height), dtype=np.uint8)
+        self.color = np.zeros((self.width, self.height), dtype=np.uint8)
+        self.stability = np.zeros((self.width, self.height), dtype=np.uint32)
+        self.frame_index = -1
+        self.generation = 0
+        self.last_beat = int(self.header[H_HEARTBEAT])
+        self.last_beat_time = time.perf_counter()
+
+        # Stats
+        self.frames_applied = 0
+        self.keyframes_applied = 0
+        self.frames_skipped = 0
+        self.torn_reads = 0
+
+    @property
+    def closed(self):
+        """True once the server closed the board, or stopped publishing without closing it (killed, crashed)."""
+        if self.header[H_CLOSED]:
+            return True
+        beat = int(self.header[H_HEARTBEAT])
+        now = time.perf_counter()
+        if beat != self.last_beat:
+            self.last_beat = beat
+            self.last_beat_time = now
+        return now - self.last_beat_time > BROADCAST_STALE_S
+
+    @property
+    def working(self):
+        return bool(self.header[H_WORKING])
+
+    def poll(self):
+        """Applies every frame published since the last poll. Returns the number of frames applied."""
+        latest = int(self.header[H_LATEST])
+        if latest <= self.frame_index:
+            return 0
+
+        start = self.frame_index + 1
+        latest_key = int(self.header[H_LATEST_KEY])
+        if self.frame_index < 0 or latest_key > self.frame_index or latest - self.frame_index >= self.slot_count:
+            # Fresh attach or behind: everything before the latest keyframe is redundant
+            self.frames_skipped += max(0, latest_key - start)
+            start = latest_key
+            if start < 0:
+                return 0
+
+        applied = 0
+        for index in range(start, latest + 1):
+            frame = self._read_slot(index)
+            if frame is None:
+                # Overwritten while we were reading: resync from a keyframe next poll
+                self.torn_reads += 1
+                self.frame_index = -1
+                break
+            self._apply(*frame)
+            self.frame_index = index
+            applied += 1
+
+        self.frames_applied += applied
+        return applied
+
+    def _read_slot(self, index):
+        slot = index % self.slot_count
+        hdr = self._slot_header(slot)
+        seq = int(hdr[S_SEQ])
+        if seq & 1 or int(hdr[S_INDEX]) != index:
+            return None
+
+        fields = hdr.copy()
+        if fields[S_KIND] == KIND_KEY:
+            data = self._slot_payload(slot).copy()
+        else:
+            size = int(fields[S_UPSERTS]) * 16 + int(fields[S_DEATHS]) * 8
+            data = self._slot_payload(slot)[:size].copy()
+
+        if int(hdr[S_SEQ]) != seq:
+            return None
+        return fields, data
+
+    def _apply(self, fields, data):
+        if fields[S_KIND] == KIND_KEY:
+            n = self.width * self.height
+            self.occupancy[:] = data[:n].reshape(self.width, self.height)
+            self.color[:] = data[n:2 * n].reshape(self.width, self.height)
+            self.stability[:] = data[2 * n:6 * n].view(np.uint32).reshape(self.width, self.height)
+            self.keyframes_applied += 1
+        else:
+            n_up = int(fields[S_UPSERTS])
+            n_dead = int(fields[S_DEATHS])
+            if fields[S_STEPPED]:
+                self.stability[self.occupancy == 1] += 1
+            if n_dead:
+                deaths = data[n_up * 16:].view(np.int32).reshape(-1, 2)
+                self.occupancy[deaths[:, 0], deaths[:, 1]] = 0
+                self.stability[deaths[:, 0], deaths[:, 1]] = 0
+            if n_up:
+                upserts = data[:n_up * 16].view(np.int32).reshape(-1, 4)
+                xs, ys = upserts[:, 0], upserts[:, 1]
+                self.occupancy[xs, ys] = 1
+                self.color[xs, ys] = upserts[:, 2]
+                self.stability[xs, ys] = upserts[:, 3]
+        self.generation = int(fields[S_GENERATION])
+
+    def live_cells(self):
+        """Board as the {(x, y): color_index} dict the renderers use."""
+        xs, ys = np.nonzero(self.occupancy)
+        return dict(zip(zip(xs.tolist(), ys.tolist()), self.color[xs, ys].tolist()))
+
+    def cell_stability(self):
+        xs, ys = np.nonzero(self.occupancy)
+        return dict(zip(zip(xs.tolist(), ys.tolist()), self.stability[xs, ys].tolist()))
+
+    def close(self):
+        if self.shm is None:
+            return
+        del self.header
+        self.shm.close()
+        self.shm = None
+
+
+# --- THROUGHPUT BENCHMARK ---
+# python conway_broadcast.py [seconds]
+# Runs the simulation flat out on a WIDTH x HEIGHT soup and measures publish/consume rates
+# with 1, 2 and 4 viewer processes.
+
+def _bench_viewer(name, results):
+    sub = BoardSubscriber(name)
+    start = time.perf_counter()
+    while not sub.closed:
+        if sub.poll() == 0:
+            time.sleep(0.001)
+    sub.poll()
+    elapsed = time.perf_counter() - start
+    results.put((sub.frames_applied / elapsed, sub.keyframes_applied, sub.frames_skipped, sub.torn_reads, sub.generation))
+    sub.close()
+
+
+def _bench_soup(params):
+    params.live_cells.clear()
+    for x in range(params.WIDTH):
+        for y in range(params.HEIGHT):
+            if np.random.random() < 0.3:
+                params.live_cells[(x, y)] = np.random.randint(len(params.ALIVE_COLOR))
+
+
+def run_benchmark(seconds=5.0):
+    from conway_dataclass import Nocap_params
+    from conway_utils import update_game_logic
+
+    name = f"{BROADCAST_NAME}_bench"
+    print(f"Board {WIDTH}x{HEIGHT}, ring {BROADCAST_RING_SLOTS} slots, keyframe every {BROADCAST_KEYFRAME_INTERVAL}")
+    for n_viewers in (1, 2, 4):
+        np.random.seed(0)
+        params = Nocap_params()
+        _bench_soup(params)
+
+        pub = BoardPublisher(name, WIDTH, HEIGHT)
+        results = multiprocessing.Queue()
+        viewers = [multiprocessing.Process(target=_bench_viewer, args=(name, results)) for _ in range(n_viewers)]
+        for v in viewers:
+            v.start()
+        time.sleep(0.5)  # let viewers attach
+
+        publish_time = 0.0
+        start = time.perf_counter()
+        while time.perf_counter() - start < seconds:
+            update_game_logic(params)
+            if params.generation % 200 == 0:
+                _bench_soup(params)
+            t0 = time.perf_counter()
+            pub.publish(params)
+            publish_time += time.perf_counter() - t0
+        elapsed = time.perf_counter() - start
+
+        frames = pub.frame_index + 1
+        pub.close()
+        stats = [results.get() for _ in viewers]
+        for v in viewers:
+            v.join()
+
+        print(f"\n[{n_viewers} viewer(s)]")
+        print(f"  publish: {frames / elapsed:8.1f} gen/s | {publish_time / frames * 1e6:7.1f} us/frame "
+              f"| {pub.bytes_written / frames / 1024:6.1f} KiB/frame | {pub.keyframes} keyframes")
+        for i, (rate, keys, skipped, torn, gen) in enumerate(stats):
+            print(f"  viewer {i}: {rate:8.1f} frames/s | {keys} keyframes | {skipped} skipped | {torn} torn | last gen {gen}")
+
+
+if __name__ == "__main__":
+    run_benchmark(float(sys.argv[1]) if len(sys.argv) > 1 else 5.0)
@@ -39,6 +39,8 @@ WIDTH = 100
 HEIGHT = 100
 PX_SIZE = 10
 WEBCAM_INDEX = 4
+CAM_SIZE = (1920, 1080)  # requested from the camera (HD from OBS)
+CAM_FPS = 0  # 0 = whatever the source delivers
 WORKING_DRAWABLE = True
 
 # OSC section
@@ -47,3 +49,42 @@ OSC_PORT = 9000  # VCV Rack default is often 9000 or 8000
 MAX_VOICES = 16  # Limit how many notes play per frame to prevent crashing VCV
 PITCH_MIN = -2.0 # -3 Octaves (C-3)
 PITCH_MAX = 4.0  # 10 Octaves (C0 to C10)
+
+# Board server section (-s / conway_viewer.py)
+BROADCAST_NAME = "conway_board"  # shared memory block name
+BROADCAST_RING_SLOTS = 64  # frames kept in the ring
+BROADCAST_KEYFRAME_INTERVAL = 16  # full board every N frames, deltas in between
+BROADCAST_STALE_S = 1.0  # heartbeat still for this long -> server is gone (viewers exit, the name can be taken over)
+
+# Startup budget for the nocap mode (--startup-profile / --startup-check)
+STARTUP_BUDGET_S = 1.5  # time to first frame
+STARTUP_BUDGET_MB = 150  # RSS at first frame
+
+# Session recording section (-r)
+RECORD_FPS = 30  # video frame rate; the screen is sampled on this wall-clock grid
+RECORD_EVERY = 1  # cap: never capture more often than every Nth presented frame
+RECORD_QUEUE_MB = 48  # screen copies waiting for the encoder (6 frames at 1080p, 2 at 4K) before new ones are dropped
+RECORD_EVENT_QUEUE_SIZE = 64  # live-cell snapshots waiting to be logged before new ones are dropped
+RECORD_FOURCC = "mp4v"
+
+# Hand tracking section (python conway_motiondetector.py [trace.npz] to tune)
+CURSOR_MIN_CUTOFF = 1.0  # Hz, smoothing of a still hand (lower = smoother)
+CURSOR_BETA = 8.0  # how fast the cutoff opens up with hand speed (higher = less lag)
+CURSOR_D_CUTOFF = 1.0  # Hz, smoothing of the velocity used for prediction
+SIZE_MIN_CUTOFF = 0.5
+SIZE_BETA = 4.0
+CAPTURE_LATENCY_S = 0.033  # camera exposure + transfer, added to measured inference time
+MAX_PREDICTION_S = 0.1  # never extrapolate further than this
+PREDICTION_FULL_SPEED = 0.3  # screen widths/s at which the full lead is applied
+CURSOR_RESET_S = 0.25  # hand gone this long -> filters restart
+PINCH_ON = 0.04  # thumb-finger distance that engages a pinch
+PINCH_OFF = 0.065  # ... and that releases it
+TRACE_MAX_ROWS = 30 * 60 * 30 * 2  # --record-landmarks keeps the last ~30 min (30 fps, two hands)
+
+# Quality governor section (webcam mode, see conway_governor.py)
+GOVERNOR_TARGET_FPS = 30  # frame budget = 1 / min(current fps cap, this)
+GOVERNOR_WINDOW = 30  # frames averaged before any decision
+GOVERNOR_DEGRADE_AT = 1.0  # mean work time above budget * this -> lower quality
+GOVERNOR_RESTORE_AT = 0.6  # mean work time below budget * this ...
+GOVERNOR_RESTORE_FRAMES = 90  # ... for this many frames -> raise quality
+GOVERNOR_MAX_RESTORE_FRAMES = 1800  # cap of the backoff after oscillation
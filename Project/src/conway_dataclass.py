@@ -1,5 +1,4 @@
 import pygame
-import cv2
 from dataclasses import dataclass, field
 from conway_config import *
 import numpy as np
@@ -7,6 +6,18 @@ from typing import Any
 
 ALIVE_COLOR_DEFAULT = ALIVE_COLOR
 
+@dataclass(frozen=True)
+class QualityLevel:
+    """One rung of the quality ladder (see conway_governor.py). Defaults = full quality."""
+    name: str = "full"
+    mp_scale: float = 1.0 # MediaPipe input resolution, relative to the webcam frame
+    smoothscale: bool = True # webcam layer: smoothscale (True) or scale (False)
+    webcam_every: int = 1 # rebuild the webcam layer every N frames
+    hud_every: int = 1 # re-render HUD text every N frames
+    sim_every: int = 1 # advance the simulation every N frames while running
+
+FULL_QUALITY = QualityLevel()
+
 @dataclass
 class Nocap_params:
     screen: pygame.Surface = field(default=None)
@@ -22,11 +33,17 @@ class Nocap_params:
     working: bool = False
     osc_client: Any = None
     cell_stability: dict[tuple, int] = field(default_factory=dict)
+    generation: int = 0
+    recorder: Any = None
+    quality: QualityLevel = FULL_QUALITY
+    frame_index: int = 0
+    hud_panel: pygame.Surface = field(default=None)
+    hud_help: pygame.Surface = field(default=None)
 
 @dataclass
 class Withcap_params:
     screen: pygame.Surface = field(default=None)
-    cap: cv2.VideoCapture = field(default=None)
+    cap: Any = field(default=None) # cv2.VideoCapture (cv2 is only imported in webcam mode)
     live_cells: dict[tuple, int] = field(default_factory=dict) # (x, y) -> color_index
     ALIVE_COLOR: list[tuple] = field(default_factory=lambda: ALIVE_COLOR_DEFAULT.copy())
     BASE_COLOR: tuple = BASE_COLOR
@@ -34,6 +51,8 @@ class Withcap_params:
     HEIGHT: int = HEIGHT
     PX_SIZE: int = PX_SIZE
     grid_surface: pygame.Surface = field(default=None)
+    webcam_surface: pygame.Surface = field(default=None) # last scaled webcam layer, reused between rebuilds
+    webcam_blit_pos: tuple = (0, 0)
     working: bool = False
 
     cursor_pos: tuple = (-1, -1)
@@ -41,6 +60,8 @@ class Withcap_params:
     hand_drawing: bool = False
     hand_erasing: bool = False
     frame_with_lm_drawn: np.ndarray = None
+    hand_latency_ms: float = 0.0 # prediction lead used by the cursor filter
+    governor: Any = None
 
     # Debounce flags (to prevent rapid-fire toggling)
     last_toggle_time: int = 0
@@ -49,4 +70,10 @@ class Withcap_params:
 
     osc_client: Any = None
     cell_stability: dict[tuple, int] = field(default_factory=dict)
+    generation: int = 0
+    recorder: Any = None
+    quality: QualityLevel = FULL_QUALITY
+    frame_index: int = 0
+    hud_panel: pygame.Surface = field(default=None)
+    hud_help: pygame.Surface = field(default=None)
     sound_posedge: set = field(default_factory=set)
@@ -0,0 +1,278 @@
+import os
+import sys
+import glob
+import time
+import cv2
+import numpy as np
+from conway_config import *
+
+# Frame sources for the webcam pipeline. All of them quack like cv2.VideoCapture
+# (read / isOpened / release), so they drop into params.cap unchanged.
+#
+#   --source 4 | device:4             live camera
+#   --source clip.mp4                 video file (looped)
+#   --source "frames/*.png" | frames/ image sequence (looped)
+#   --source synthetic                generated frames, no camera needed
+
+
+class FrameSource:
+    """Base class: optional real-time pacing and a one-line description."""
+
+    def __init__(self, size, fps, realtime):
+        self.size = size
+        self.fps = fps
+        self.realtime = realtime
+        self.frames_read = 0
+        self._t0 = None
+
+    def _pace(self):
+        # Behave like a camera: hand out frames no faster than `fps`
+        if not self.realtime or not self.fps:
+            return
+        if self._t0 is None:
+            self._t0 = time.perf_counter()
+        due = self._t0 + self.frames_read / self.fps
+        delay = due - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+    def isOpened(self):
+        return True
+
+    def release(self):
+        pass
+
+    def describe(self):
+        w, h = self.size
+        return f"{type(self).__name__} {w}x{h} @ {self.fps:.1f} fps"
+
+
+class DeviceSource(FrameSource):
+    def __init__(self, index, size, fps):
+        self.cap = cv2.VideoCapture(index)
+        self.index = index
+        if self.cap.isOpened():
+            # Ask for a mode, then read back what the driver actually gave us
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, size[0])
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, size[1])
+            if fps:
+                self.cap.set(cv2.CAP_PROP_FPS, fps)
+            size = (int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+            fps = self.cap.get(cv2.CAP_PROP_FPS) or fps
+        super().__init__(size, fps, realtime=False)  # the device paces itself
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def read(self):
+        ret, frame = self.cap.read()
+        self.frames_read += ret
+        return ret, frame
+
+    def release(self):
+        self.cap.release()
+
+    def describe(self):
+        return f"device {self.index}: " + super().describe()
+
+
+class VideoFileSource(FrameSource):
+    def __init__(self, path, realtime=True, loop=True):
+        self.cap = cv2.VideoCapture(path)
+        self.path = path
+        self.loop = loop
+        size = (int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+        super().__init__(size, self.cap.get(cv2.CAP_PROP_FPS) or 30.0, realtime)
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def read(self):
+        self._pace()
+        ret, frame = self.cap.read()
+        if not ret and self.loop and self.frames_read > 0:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self.cap.read()
+        self.frames_read += ret
+        return ret, frame
+
+    def release(self):
+        self.cap.release()
+
+    def describe(self):
+        return f"{self.path}: " + super().describe()
+
+
+class ImageSequenceSource(FrameSource):
+    def __init__(self, pattern, fps=30.0, realtime=True, loop=True):
+        if os.path.isdir(pattern):
+            pattern = os.path.join(pattern, "*")
+        exts = (".png", ".jpg", ".jpeg", ".bmp")
+        self.paths = sorted(p for p in glob.glob(pattern) if p.lower().endswith(exts))
+        self.pattern = pattern
+        self.loop = loop
+        first = cv2.imread(self.paths[0]) if self.paths else None
+        size = (first.shape[1], first.shape[0]) if first is not None else (0, 0)
+        super().__init__(size, fps, realtime)
+
+    def isOpened(self):
+        return bool(self.paths)
+
+    def read(self):
+        if not self.paths or (not self.loop and self.frames_read >= len(self.paths)):
+            return False, None
+        self._pace()
+        frame = cv2.imread(self.paths[self.frames_read % len(self.paths)])
+        self.frames_read += 1
+        return frame is not None, frame
+
+    def describe(self):
+        return f"{self.pattern} ({len(self.paths)} images): " + super().describe()
+
+
+class SyntheticSource(FrameSource):
+    """Dark gradient with a moving skin-toned blob. Deterministic, no I/O."""
+
+    def __init__(self, size, fps=30.0, realtime=True, frames=None):
+        super().__init__(size, fps, realtime)
+        self.frames = frames
+        w, h = size
+        gradient = np.linspace(20, 90, w, dtype=np.float32)[None, :, None]
+        self.background = np.broadcast_to(gradient, (h, w, 3)).astype(np.uint8)
+
+    def read(self):
+        if self.frames is not None and self.frames_read >= self.frames:
+            return False, None
+        self._pace()
+        w, h = self.size
+        t = self.frames_read / self.fps
+        frame = self.background.copy()
+        center = (int(w * (0.5 + 0.3 * np.cos(t))), int(h * (0.5 + 0.3 * np.sin(1.3 * t))))
+        cv2.circle(frame, center, h // 8, (120, 160, 220), -1)
+        self.frames_read += 1
+        return True, frame
+
+
+def open_source(spec, size=CAM_SIZE, fps=CAM_FPS, realtime=True):
+    """Builds a frame source from a --source spec (see top of file)."""
+    spec = str(spec)
+    if spec.isdigit() or spec.startswith("device:"):
+        return DeviceSource(int(spec.split(":")[-1]), size, fps)
+    if spec == "synthetic":
+        return SyntheticSource(size, fps or 30.0, realtime)
+    if os.path.isdir(spec) or any(c in spec for c in "*?["):
+        return ImageSequenceSource(spec, fps or 30.0, realtime)
+    return VideoFileSource(spec, realtime)
+
+
+def probe_devices(indices=range(0, 11), size=CAM_SIZE):
+    """Non-interactive: opens each index, grabs one frame, reports what was negotiated."""
+    found = []
+    for index in indices:
+        src = DeviceSource(index, size, 0)
+        if not src.isOpened():
+            print(f"[FAIL] No camera at Index {index}")
+            continue
+        t0 = time.perf_counter()
+        ret, frame = src.read()
+        latency = (time.perf_counter() - t0) * 1000
+        if ret:
+            print(f"[SUCCESS] {src.describe()} | first frame {frame.shape[1]}x{frame.shape[0]} in {latency:.0f} ms")
+            found.append(index)
+        else:
+            print(f"[FAIL] Camera at Index {index} opened but returned no frame")
+        src.release()
+    return found
+
+
+# --- PIPELINE BENCHMARK ---
+# SDL_VIDEODRIVER=dummy python conway_framesource.py [video ...]
+# Plays each video at max speed through decode -> flip -> inference -> composite and
+# reports per-stage throughput. Without arguments, 720p/1080p/4K test clips are generated.
+
+BENCH_SIZES = {"720p": (1280, 720), "1080p": (1920, 1080), "4K": (3840, 2160)}
+
+
+def _make_clip(path, size, frames=120):
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), 30.0, size)
+    src = SyntheticSource(size, realtime=False, frames=frames)
+    while True:
+        ret, frame = src.read()
+        if not ret:
+            break
+        writer.write(frame)
+    writer.release()
+
+
+def run_benchmark(paths=None, max_frames=120):
+    import tempfile
+    import pygame
+    from conway_dataclass import Withcap_params
+    from conway_utils import render_withcap, draw_hud, make_grid_surface
+
+    if not paths:
+        tmp = tempfile.mkdtemp(prefix="conway_src_")
+        paths = []
+        for label, size in BENCH_SIZES.items():
+            path = os.path.join(tmp, f"{label}.mp4")
+            print(f"Generating {label} test clip...")
+            _make_clip(path, size)
+            paths.append(path)
+
+    try:
+        from conway_motiondetector import HandController
+        hand_controller = HandController()
+    except ImportError:
+        hand_controller = None
+        print("mediapipe not installed: inference stage skipped")
+
+    pygame.init()
+    params = Withcap_params()
+    params.screen = pygame.display.set_mode((params.WIDTH * PX_SIZE, params.HEIGHT * PX_SIZE))
+    params.grid_surface = make_grid_surface(params)
+
+    stages = ("decode", "flip", "inference", "composite")
+    print(f"\n{'source':<28}" + "".join(f"{s:>18}" for s in stages) + f"{'total':>18}")
+    for path in paths:
+        src = VideoFileSource(path, realtime=False, loop=False)
+        if not src.isOpened():
+            print(f"{path}: could not open"); continue
+        times = dict.fromkeys(stages, 0.0)
+        frames = 0
+        params.webcam_surface = None
+        while frames < max_frames:
+            t0 = time.perf_counter()
+            ret, frame = src.read()
+            t1 = time.perf_counter()
+            if not ret:
+                break
+            frame = cv2.flip(frame, 1)
+            t2 = time.perf_counter()
+            if hand_controller:
+                frame = hand_controller.process(frame, params)
+            t3 = time.perf_counter()
+            params.frame_with_lm_drawn = frame
+            render_withcap(params)
+            draw_hud(params, 0)
+            pygame.display.update()
+            t4 = time.perf_counter()
+            for stage, dt in zip(stages, (t1 - t0, t2 - t1, t3 - t2, t4 - t3)):
+                times[stage] += dt
+            params.frame_index += 1
+            frames += 1
+        src.release()
+        if not frames:
+            continue
+
+        def cell(seconds):
+            ms = seconds / frames * 1000
+            return f"{ms:7.2f}ms {1000 / ms if ms > 0.01 else 0:5.0f}/s"
+        w, h = src.size
+        label = f"{os.path.basename(path)} {w}x{h}"
+        print(f"{label:<28}" + "".join(f"{cell(times[s]) if s != 'inference' or hand_controller else '-':>18}" for s in stages)
+              + f"{cell(sum(times.values())):>18}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    run_benchmark(sys.argv[1:])
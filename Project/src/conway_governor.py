@@ -0,0 +1,83 @@
+from collections import deque
+from conway_config import *
+from conway_dataclass import QualityLevel, FULL_QUALITY
+
+# Cheapest visible loss first; each rung keeps the savings of the ones above it.
+QUALITY_LADDER = [
+    FULL_QUALITY,
+    QualityLevel("hud/5", hud_every=5),
+    QualityLevel("fast scale", hud_every=5, smoothscale=False),
+    QualityLevel("mp 1/2", hud_every=5, smoothscale=False, mp_scale=0.5),
+    QualityLevel("webcam/2", hud_every=5, smoothscale=False, mp_scale=0.5, webcam_every=2),
+    QualityLevel("mp 1/3", hud_every=10, smoothscale=False, mp_scale=0.35, webcam_every=3),
+    QualityLevel("sim/2", hud_every=10, smoothscale=False, mp_scale=0.35, webcam_every=3, sim_every=2),
+]
+
+
+class QualityGovernor:
+    """
+    Watches the rolling mean of the main loop's work time (excluding the clock.tick sleep)
+    and walks QUALITY_LADDER to keep it under the frame budget.
+    - Over budget for a full window       -> one rung down immediately.
+    - Well under budget for restore_after -> one rung up.
+    - A restore that is undone soon after doubles restore_after, so a level that cannot
+      be sustained is not retried every few seconds.
+    """
+
+    def __init__(self, ladder=QUALITY_LADDER, target_fps=GOVERNOR_TARGET_FPS):
+        self.ladder = ladder
+        self.target_fps = target_fps
+        self.level = 0
+        self.times = deque(maxlen=GOVERNOR_WINDOW)
+        self.restore_after = GOVERNOR_RESTORE_FRAMES
+        self.headroom_frames = 0
+        self.frame = 0
+        self.last_restore = None
+        self.last_degrade = 0
+
+    def budget(self, fps):
+        """Seconds available per frame at the current frame cap."""
+        return 1.0 / min(fps, self.target_fps)
+
+    @property
+    def mean_ms(self):
+        return sum(self.times) / len(self.times) * 1000 if self.times else 0.0
+
+    def update(self, params, work_s, fps):
+        self.frame += 1
+        self.times.append(work_s)
+        if len(self.times) < self.times.maxlen:
+            return
+
+        budget = self.budget(fps)
+        mean = sum(self.times) / len(self.times)
+
+        if mean > budget * GOVERNOR_DEGRADE_AT:
+            self.headroom_frames = 0
+            if self.level < len(self.ladder) - 1:
+                if self.last_restore is not None and self.frame - self.last_restore < self.restore_after:
+                    self.restore_after = min(self.restore_after * 2, GOVERNOR_MAX_RESTORE_FRAMES)
+                self.last_degrade = self.frame
+                self._set(params, self.level + 1)
+        elif mean < budget * GOVERNOR_RESTORE_AT and self.level > 0:
+            self.headroom_frames += 1
+            if self.headroom_frames >= self.restore_after:
+                self.last_restore = self.frame
+                self._set(params, self.level - 1)
+        else:
+            self.headroom_frames = 0
+
+        # Stable for a long time: forget past oscillation
+        if self.frame - self.last_degrade > GOVERNOR_MAX_RESTORE_FRAMES:
+            self.restore_after = GOVERNOR_RESTORE_FRAMES
+
+    def _set(self, params, level):
+        self.level = level
+        params.quality = self.ladder[level]
+        params.hud_panel = None  # show the new level right away
+        self.times.clear()
+        self.headroom_frames = 0
+
+    def hud_line(self):
+        color = (200, 200, 200) if self.level == 0 else (255, 165, 0)
+        return (f"Quality: {self.level}/{len(self.ladder) - 1} {self.ladder[self.level].name} | {self.mean_ms:.0f} ms", color)
@@ -1,15 +1,16 @@
+import conway_startup as startup
 import pygame
 import numpy as np
 import signal, sys
 import argparse
-import cv2
 import time
-import mediapipe as mp
-from pythonosc import udp_client
+import atexit
 from conway_config import *
 from conway_dataclass import *
 from conway_utils import *
-from conway_motiondetector import HandController
+startup.mark("core imports (pygame, numpy, psutil)")
+
+# cv2 / mediapipe / python-osc are only imported by the modes that use them (-w, -s)
 
 # signal handler for graceful exit
 def graceful_shutdown(sig, frame):
@@ -24,7 +25,8 @@ def main():
     params = None
     clock = pygame.time.Clock()
     fps = DRAWING_FPS
-    hand_controller = HandController()
+    hand_controller = None
+    publisher = None
 
     # pygame setup
     pygame.init()
@@ -35,16 +37,46 @@ def main():
     parser = argparse.ArgumentParser(description="Conway's Game of Life")
     parser.add_argument('-f', '--fullscreen', action='store_true', help='Run in full-screen mode')
     parser.add_argument('-w', '--webcam', action='store_true', help='Use webcam as background')
+    parser.add_argument('--source', default=None, metavar='SPEC',
+                        help='Frame source for -w (implies -w): camera index, video file, image glob/dir or "synthetic"')
+    parser.add_argument('--cam-size', type=parse_size, default=CAM_SIZE, metavar='WxH', help='Requested capture resolution')
+    parser.add_argument('--cam-fps', type=float, default=CAM_FPS, help='Requested capture frame rate (0 = source default)')
+    parser.add_argument('-s', '--serve', nargs='?', const=BROADCAST_NAME, default=None, metavar='NAME',
+                        help='Publish every generation to shared memory for conway_viewer.py')
+    parser.add_argument('-r', '--record', nargs='?', const=time.strftime("session_%Y%m%d_%H%M%S"), default=None, metavar='PREFIX',
+                        help='Record the session to PREFIX.mp4 and PREFIX.events.txt.gz')
+    parser.add_argument('--record-every', type=int, default=RECORD_EVERY, metavar='N', help='Capture at most every Nth presented frame (the video is always timed by the wall clock)')
+    parser.add_argument('--record-landmarks', default=None, metavar='PATH',
+                        help='Save hand landmark traces to PATH (.npz) for conway_motiondetector.py tuning')
+    parser.add_argument('--no-governor', action='store_true', help='Webcam mode: always run at full quality')
+    parser.add_argument('--target-fps', type=int, default=GOVERNOR_TARGET_FPS, help='Webcam mode: frame rate the governor holds')
+    parser.add_argument('--startup-profile', action='store_true', help='Print import times, time to first frame and RSS')
+    parser.add_argument('--startup-check', action='store_true',
+                        help='Exit after the first frame; non-zero if the nocap startup budget is exceeded')
     args = parser.parse_args()
+    if args.source is not None:
+        args.webcam = True
+    startup.mark("pygame init + args")
 
     if args.webcam:
+        with startup.timed("cv2 + mediapipe (hand tracking)"):
+            import cv2
+            from conway_motiondetector import HandController
+        with startup.timed("HandController()"):
+            hand_controller = HandController(record_trace=bool(args.record_landmarks))
+        if args.record_landmarks:
+            atexit.register(hand_controller.save_trace, args.record_landmarks)
+
         render = render_withcap
         params = Withcap_params()
-        # NOTE: Ensure WEBCAM_INDEX matches your OBS Virtual Camera index
-        params.cap = cv2.VideoCapture(WEBCAM_INDEX)
+        # NOTE: Ensure WEBCAM_INDEX matches your OBS Virtual Camera index (or pass --source)
+        with startup.timed("webcam open"):
+            from conway_framesource import open_source
+            params.cap = open_source(args.source or WEBCAM_INDEX, args.cam_size, args.cam_fps)
         if not params.cap.isOpened():
             print("Error: Could not open webcam.")
             sys.exit(1)
+        print(f"Frame source: {params.cap.describe()}")
     else:
         render = render_nocap
         params = Nocap_params()
@@ -63,24 +95,48 @@ def main():
     if args.webcam is False:
         params.screen.fill(BASE_COLOR)
     else:
-        # Request HD resolution from OBS/Camera
-        params.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1920)
-        params.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 1080)
-        
         # Create Grid
-        params.grid_surface = pygame.Surface((params.WIDTH*PX_SIZE, params.HEIGHT*PX_SIZE), pygame.SRCALPHA)
-        # Use a slightly transparent color for grid lines
-        grid_color = (params.BASE_COLOR[0], params.BASE_COLOR[1], params.BASE_COLOR[2], 100) 
-        for x in range(0, params.WIDTH):
-            pygame.draw.line(params.grid_surface, grid_color, (x*PX_SIZE, 0), (x*PX_SIZE, params.HEIGHT * PX_SIZE))
-        for y in range(0, params.HEIGHT):
-            pygame.draw.line(params.grid_surface, grid_color, (0, y*PX_SIZE), (params.WIDTH * PX_SIZE, y*PX_SIZE))
-
-    client = udp_client.SimpleUDPClient(OSC_IP, OSC_PORT)
-    params.osc_client = client
-    
+        params.grid_surface = make_grid_surface(params)
+
+        if not args.no_governor:
+            from conway_governor import QualityGovernor
+            params.governor = QualityGovernor(target_fps=args.target_fps)
+
+        # Sound is driven by the hand cursor, so OSC is only needed with the webcam
+        with startup.timed("python-osc"):
+            from pythonosc import udp_client
+            params.osc_client = udp_client.SimpleUDPClient(OSC_IP, OSC_PORT)
+
+    if args.record:
+        from conway_recorder import SessionRecorder
+        try:
+            params.recorder = SessionRecorder(args.record, params.screen.get_size(), every=args.record_every)
+        except IOError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        atexit.register(params.recorder.close)
+        print(f"Recording to {args.record}.mp4")
+
+    # Last, so no slow setup runs between the first heartbeat and the main loop:
+    # viewers count a server whose heartbeat stalls as gone
+    if args.serve:
+        with startup.timed("board server"):
+            from conway_broadcast import BoardPublisher
+            try:
+                publisher = BoardPublisher(args.serve, params.WIDTH, params.HEIGHT)
+            except FileExistsError as e:
+                print(f"Error: {e}")
+                sys.exit(1)
+        atexit.register(publisher.close)
+        print(f"Serving board on shared memory '{args.serve}'")
+    startup.mark("display + mode setup")
+    first_frame = True
+
     # main loop
     while True:
+        loop_start = time.perf_counter()
+        read_s = 0.0
+        sleep_s = 0.0
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 graceful_shutdown(None, None)
@@ -109,7 +165,9 @@ def main():
 
         # hand input
         if isinstance(params, Withcap_params):
+            read_start = time.perf_counter()
             ret, frame = params.cap.read()
+            read_s = time.perf_counter() - read_start # mostly waiting for the camera: not ours to optimize
             if not ret:
                 print("Error: Could not read frame from webcam.")
                 sys.exit(1)
@@ -160,9 +218,13 @@ def main():
             if key_pressed[pygame.K_n]:
                 update_game_logic(params)
                 time.sleep(0.08)
-        else:
+                sleep_s = 0.08  # step-rate limiter, not work
+        elif params.frame_index % params.quality.sim_every == 0:
             # Automatic advance
             update_game_logic(params)
+
+        if publisher:
+            publisher.publish(params)
             
         # --- SOUND LOGIC (Always Run) ---
         # This ensures we can hear static cells when paused,
@@ -172,7 +234,24 @@ def main():
             
         render(params)
         draw_hud(params, clock.get_fps())
+        if params.recorder:
+            params.recorder.capture(params)
         pygame.display.update()
+
+        if first_frame and (args.startup_profile or args.startup_check):
+            startup.mark("first frame")
+            rss_mb = PROCESS.memory_info().rss / 1024 / 1024
+            if args.webcam:
+                ok = startup.report(rss_mb)
+            else:
+                ok = startup.report(rss_mb, STARTUP_BUDGET_S, STARTUP_BUDGET_MB, forbidden=startup.HEAVY_MODULES)
+            if args.startup_check:
+                pygame.quit(); sys.exit(0 if ok else 1)
+        first_frame = False
+
+        if isinstance(params, Withcap_params) and params.governor:
+            params.governor.update(params, time.perf_counter() - loop_start - read_s - sleep_s, fps)
+        params.frame_index += 1
         clock.tick(fps)
 
 if __name__ == "__main__":
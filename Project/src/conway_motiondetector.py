@@ -1,13 +1,120 @@
 import cv2
-import mediapipe as mp
 from conway_dataclass import Withcap_params
+import sys
 import math
 import time
 import numpy as np
-from conway_config import PX_SIZE
+from conway_config import *
+
+
+class OneEuroFilter:
+    """
+    One-Euro filter (Casiez et al., CHI 2012).
+    The cutoff frequency rises with the (filtered) speed: a still hand is smoothed hard,
+    a moving hand is barely lagged.
+    """
+
+    def __init__(self, min_cutoff, beta, d_cutoff=1.0):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset()
+
+    def reset(self):
+        self.x_prev = None
+        self.dx_prev = 0.0
+        self.t_prev = None
+
+    @staticmethod
+    def _alpha(cutoff, dt):
+        tau = 1.0 / (2 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    @property
+    def velocity(self):
+        return self.dx_prev
+
+    def __call__(self, x, t):
+        if self.t_prev is None:
+            self.x_prev, self.t_prev = x, t
+            return x
+
+        dt = max(t - self.t_prev, 1e-6)
+        # 1. Smoothed derivative
+        a_d = self._alpha(self.d_cutoff, dt)
+        dx = a_d * ((x - self.x_prev) / dt) + (1 - a_d) * self.dx_prev
+        # 2. Speed-dependent cutoff
+        a = self._alpha(self.min_cutoff + self.beta * abs(dx), dt)
+        x_hat = a * x + (1 - a) * self.x_prev
+
+        self.x_prev, self.dx_prev, self.t_prev = x_hat, dx, t
+        return x_hat
+
+
+class CursorFilter:
+    """
+    Smooths the cursor (thumb/index midpoint, normalized 0..1) and its pinch width,
+    then extrapolates the position `lead` seconds ahead along the filtered velocity
+    to cancel capture + inference latency.
+    """
 
-class HandController:
     def __init__(self):
+        self.fx = OneEuroFilter(CURSOR_MIN_CUTOFF, CURSOR_BETA, CURSOR_D_CUTOFF)
+        self.fy = OneEuroFilter(CURSOR_MIN_CUTOFF, CURSOR_BETA, CURSOR_D_CUTOFF)
+        self.fsize = OneEuroFilter(SIZE_MIN_CUTOFF, SIZE_BETA, CURSOR_D_CUTOFF)
+        self.t_last = None
+
+    def reset(self):
+        self.fx.reset(); self.fy.reset(); self.fsize.reset()
+        self.t_last = None
+
+    def update(self, x, y, width, t, lead):
+        # Hand was lost for a while: start fresh instead of gliding from the old position
+        if self.t_last is not None and t - self.t_last > CURSOR_RESET_S:
+            self.reset()
+        self.t_last = t
+
+        sx = self.fx(x, t)
+        sy = self.fy(y, t)
+        # Fade prediction in with speed: extrapolating a still hand only amplifies noise
+        vx, vy = self.fx.velocity, self.fy.velocity
+        lead *= min(1.0, math.hypot(vx, vy) / PREDICTION_FULL_SPEED)
+        px = min(1.0, max(0.0, sx + vx * lead))
+        py = min(1.0, max(0.0, sy + vy * lead))
+        return px, py, self.fsize(width, t)
+
+
+class PinchState:
+    """
+    Controller-hand pinch with hysteresis: a pinch engages below PINCH_ON and
+    holds until the same finger opens past PINCH_OFF, so noise around one threshold cannot flicker it.
+    """
+    GESTURES = ("draw", "erase", "random", "clear")  # thumb to index / middle / ring / pinky
+
+    def __init__(self, on=PINCH_ON, off=PINCH_OFF):
+        self.on = on
+        self.off = off
+        self.active = None
+
+    def reset(self):
+        self.active = None
+
+    def update(self, distances):
+        """distances in GESTURES order. Returns (active gesture or None, True if it just engaged)."""
+        if self.active is not None and distances[self.GESTURES.index(self.active)] < self.off:
+            return self.active, False
+
+        self.active = None
+        for name, d in zip(self.GESTURES, distances):
+            if d < self.on:
+                self.active = name
+                return name, True
+        return None, False
+
+
+class HandController:
+    def __init__(self, record_trace=False):
+        import mediapipe as mp
         self.mp_hands = mp.solutions.hands
         self.hands = self.mp_hands.Hands(
             static_image_mode=False,
@@ -17,58 +124,110 @@ class HandController:
         )
         self.mp_draw = mp.solutions.drawing_utils
 
+        self.cursor_filter = CursorFilter()
+        self.pinch = PinchState()
+        self.inference_s = 0.0  # EMA of MediaPipe time per frame
+
+        # Landmark trace for offline tuning: rows of (t, role, 21 x (x, y)), role 0 = cursor, 1 = controller.
+        # Preallocated ring: the newest TRACE_MAX_ROWS rows are kept.
+        self.trace_rows = 0
+        if record_trace:
+            self.trace = (np.zeros(TRACE_MAX_ROWS), np.zeros(TRACE_MAX_ROWS, dtype=np.uint8),
+                          np.zeros((TRACE_MAX_ROWS, 21, 2), dtype=np.float32))
+        else:
+            self.trace = None
+
+    @property
+    def lead_s(self):
+        """How far ahead to predict: frame capture + inference, capped so errors stay small."""
+        return min(CAPTURE_LATENCY_S + self.inference_s, MAX_PREDICTION_S)
+
     def calculate_distance(self, p1, p2):
         return math.hypot(p2.x - p1.x, p2.y - p1.y)
 
     def process(self, frame, params: Withcap_params):
-        img_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        t = time.perf_counter()
+        # Landmarks are normalized, so MediaPipe can run on a downscaled copy (quality governor)
+        scale = params.quality.mp_scale
+        small = frame if scale >= 1.0 else cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_LINEAR)
+        img_rgb = cv2.cvtColor(small, cv2.COLOR_BGR2RGB)
         results = self.hands.process(img_rgb)
+        self.inference_s = 0.9 * self.inference_s + 0.1 * (time.perf_counter() - t)
+        params.hand_latency_ms = self.lead_s * 1000
 
         params.hand_drawing = False
         params.hand_erasing = False
         params.cursor_pos = (-1, -1)
+        controller_seen = False
 
         if results.multi_hand_landmarks:
             hands_data = list(zip(results.multi_hand_landmarks, results.multi_handedness))
-            
+
             # CASE 1: Two Hands
             if len(hands_data) == 2:
                 # Sort by Wrist X: Lower X (Left) = Controller, Higher X (Right) = Cursor
                 hands_data.sort(key=lambda h: h[0].landmark[0].x)
-                self._process_controller_hand(frame, hands_data[0][0], params)
-                self._process_cursor_hand(frame, hands_data[1][0], params)
+                self._process_controller_hand(frame, hands_data[0][0], params, t)
+                self._process_cursor_hand(frame, hands_data[1][0], params, t)
+                controller_seen = True
 
             # CASE 2: One Hand
             elif len(hands_data) == 1:
                 landmarks, handedness = hands_data[0]
                 label = handedness.classification[0].label
                 if label == "Right":
-                    self._process_cursor_hand(frame, landmarks, params)
+                    self._process_cursor_hand(frame, landmarks, params, t)
                 else:
-                    self._process_controller_hand(frame, landmarks, params)
+                    self._process_controller_hand(frame, landmarks, params, t)
+                    controller_seen = True
 
             # Draw skeletons
             for landmarks, _ in hands_data:
-                self.mp_draw.draw_landmarks(frame, landmarks, self.mp_hands.HAND_CONNECTIONS, 
+                self.mp_draw.draw_landmarks(frame, landmarks, self.mp_hands.HAND_CONNECTIONS,
                                             self.mp_draw.DrawingSpec(color=(0,0,255), thickness=2, circle_radius=2),
                                             self.mp_draw.DrawingSpec(color=(0,255,0), thickness=2, circle_radius=2))
-        
+
+        # A pinch must be re-engaged after the controller hand leaves the frame
+        if not controller_seen:
+            self.pinch.reset()
+
         return frame
 
-    def _process_cursor_hand(self, frame, hand_landmarks, params: Withcap_params):
+    def _record(self, t, role, hand_landmarks):
+        if self.trace is not None:
+            i = self.trace_rows % TRACE_MAX_ROWS
+            self.trace[0][i] = t
+            self.trace[1][i] = role
+            self.trace[2][i] = [(lm.x, lm.y) for lm in hand_landmarks.landmark]
+            self.trace_rows += 1
+
+    def save_trace(self, path):
+        if not self.trace_rows:
+            return
+        n = min(self.trace_rows, TRACE_MAX_ROWS)
+        order = np.roll(np.arange(n), -(self.trace_rows % n))  # oldest row first
+        t, role, landmarks = (a[order] for a in self.trace)
+        np.savez_compressed(path, lead=self.lead_s, t=t, role=role, landmarks=landmarks)
+        dropped = self.trace_rows - n
+        print(f"Saved {n} landmark rows to {path}" + (f" ({dropped} oldest dropped)" if dropped else ""))
+
+    def _process_cursor_hand(self, frame, hand_landmarks, params: Withcap_params, t):
+        self._record(t, 0, hand_landmarks)
         r_thumb = hand_landmarks.landmark[4]
         r_index = hand_landmarks.landmark[8]
 
-        # 1. Pos
+        # 1. Pos + Size (filtered, predicted ahead)
         r_mid_x = (r_thumb.x + r_index.x) / 2
         r_mid_y = (r_thumb.y + r_index.y) / 2
-        cx = int(r_mid_x * params.WIDTH * PX_SIZE)
-        cy = int(r_mid_y * params.HEIGHT * PX_SIZE)
+        distance = math.hypot(r_index.x - r_thumb.x, r_index.y - r_thumb.y)
+        px, py, width = self.cursor_filter.update(r_mid_x, r_mid_y, distance, t, self.lead_s)
+
+        cx = int(px * params.WIDTH * PX_SIZE)
+        cy = int(py * params.HEIGHT * PX_SIZE)
         params.cursor_pos = (cx, cy)
 
         # 2. Size
-        distance = math.hypot(r_index.x - r_thumb.x, r_index.y - r_thumb.y)
-        raw_size = int(distance * 40)
+        raw_size = int(width * 40)
         params.cursor_size = max(1, min(raw_size, 15))
 
         # Visual line (Use frame dimensions!)
@@ -77,7 +236,8 @@ class HandController:
         ix, iy = int(r_index.x * w), int(r_index.y * h)
         cv2.line(frame, (tx, ty), (ix, iy), (255, 0, 255), 2)
 
-    def _process_controller_hand(self, frame, hand_landmarks, params: Withcap_params):
+    def _process_controller_hand(self, frame, hand_landmarks, params: Withcap_params, t):
+        self._record(t, 1, hand_landmarks)
         l_thumb = hand_landmarks.landmark[4]
         l_index = hand_landmarks.landmark[8]
         l_middle = hand_landmarks.landmark[12]
@@ -86,50 +246,138 @@ class HandController:
 
         # Visual Lines (Use frame dimensions!)
         h, w, _ = frame.shape
-        cv2.line(frame, 
-                 (int(l_thumb.x * w), int(l_thumb.y * h)), 
-                 (int(l_index.x * w), int(l_index.y * h)), 
+        cv2.line(frame,
+                 (int(l_thumb.x * w), int(l_thumb.y * h)),
+                 (int(l_index.x * w), int(l_index.y * h)),
                  (255, 255, 0), 3)
 
+        gesture, engaged = self.pinch.update([self.calculate_distance(l_thumb, f) for f in (l_index, l_middle, l_ring, l_pinky)])
+
         # 1. DRAW
-        if self.calculate_distance(l_thumb, l_index) < 0.05:
+        if gesture == "draw":
             params.hand_drawing = True
         # 2. ERASE
-        elif self.calculate_distance(l_thumb, l_middle) < 0.05:
+        elif gesture == "erase":
             params.hand_erasing = True
-        # 3. RANDOM
-        elif self.calculate_distance(l_thumb, l_ring) < 0.05:
-            current_time = time.time()
-            if current_time - params.last_random_time > 1.0 and not params.working:
+        # 3. RANDOM (once per pinch)
+        elif gesture == "random" and engaged:
+            if t - params.last_random_time > 1.0 and not params.working:
                 params.live_cells.clear()
                 for x in range(params.WIDTH):
                     for y in range(params.HEIGHT):
                         if np.random.random() < 0.3:
                             params.live_cells[(x, y)] = np.random.randint(len(params.ALIVE_COLOR))
-                params.last_random_time = current_time
-        # 4. CLEAR
-        elif self.calculate_distance(l_thumb, l_pinky) < 0.05:
-            current_time = time.time()
-            if current_time - params.last_clear_time > 1.0 and not params.working:
+                params.last_random_time = t
+        # 4. CLEAR (once per pinch)
+        elif gesture == "clear" and engaged:
+            if t - params.last_clear_time > 1.0 and not params.working:
                 params.live_cells.clear()
-                params.last_clear_time = current_time
-        
+                params.last_clear_time = t
+
         # 5. TOGGLE (Angle)
         dy = l_index.y - l_thumb.y
         dx = l_index.x - l_thumb.x
         angle = math.degrees(math.atan2(dy, dx))
-        
+
         is_horizontal = abs(angle) < 25 or abs(angle) > 155
         is_open_hand = self.calculate_distance(l_thumb, l_index) > self.calculate_distance(l_index, hand_landmarks.landmark[5])
 
-        current_time = time.time()
-        if is_horizontal and is_open_hand and (current_time - params.last_toggle_time > 1.0):
+        if is_horizontal and is_open_hand and (t - params.last_toggle_time > 1.0):
             params.working = 1 - params.working
-            params.last_toggle_time = current_time
+            params.last_toggle_time = t
             print(f"Toggle! Angle: {int(angle)}°")
 
             # Green Line for Toggle
-            cv2.line(frame, 
-                    (int(l_thumb.x * w), int(l_thumb.y * h)), 
-                    (int(l_index.x * w), int(l_index.y * h)), 
+            cv2.line(frame,
+                    (int(l_thumb.x * w), int(l_thumb.y * h)),
+                    (int(l_index.x * w), int(l_index.y * h)),
                     (0, 255, 0), 3)
+
+
+# --- FILTER TUNING BENCHMARK ---
+# python conway_motiondetector.py [trace.npz]
+# Replays a landmark trace (recorded with `conway_main.py -w --record-landmarks trace.npz`)
+# through the raw mapping and the filtered/predicted one. Without a trace a synthetic one
+# with known ground truth and pipeline latency is used, so end-to-end latency can be measured.
+
+def _synthetic_trace(fps=30.0, seconds=20.0, latency=0.06, noise=0.003, seed=0):
+    rng = np.random.default_rng(seed)
+    t = np.arange(0, seconds, 1.0 / fps)
+    # hold still / slow circle / fast horizontal swipes
+    x = np.where(t < 5, 0.5, np.where(t < 12, 0.5 + 0.2 * np.cos(0.8 * (t - 5)), 0.5 + 0.3 * np.sin(4.0 * (t - 12))))
+    y = np.where(t < 5, 0.5, np.where(t < 12, 0.5 + 0.2 * np.sin(0.8 * (t - 5)), 0.5))
+    width = 0.1 + 0.02 * np.sin(0.5 * t)
+    # The tracker reports where the hand was `latency` seconds ago, plus noise
+    seen_x = np.interp(t - latency, t, x) + rng.normal(0, noise, t.size)
+    seen_y = np.interp(t - latency, t, y) + rng.normal(0, noise, t.size)
+    seen_w = np.interp(t - latency, t, width) + rng.normal(0, noise, t.size)
+    # Controller pinch hovering around the old 0.05 threshold
+    pinch = 0.05 + 0.01 * np.sin(0.7 * t) + rng.normal(0, 0.006, t.size)
+    return t, (seen_x, seen_y, seen_w), (x, y), pinch
+
+
+def _lag_s(t, ref_xy, out_xy, max_lag=0.3):
+    """Delay of `out` behind `ref` that best aligns the two trajectories."""
+    best, best_err = 0.0, float("inf")
+    valid = t > t[0] + max_lag
+    for shift in np.arange(-0.1, max_lag, 0.002):
+        err = sum(np.mean((np.interp(t[valid] - shift, t, r) - o[valid]) ** 2) for r, o in zip(ref_xy, out_xy))
+        if err < best_err:
+            best, best_err = shift, err
+    return best
+
+
+def _jitter_px(xy, hold=None):
+    """RMS frame-to-frame acceleration, in screen pixels: high-frequency noise the eye sees as shake."""
+    scale = WIDTH * PX_SIZE
+    d2 = [np.diff(a[hold] if hold is not None else a, 2) for a in xy]
+    return float(np.sqrt(np.mean(d2[0] ** 2 + d2[1] ** 2)) * scale)
+
+
+def _pinch_flicker(pinch):
+    old = sum(1 for a, b in zip(pinch[:-1] < 0.05, pinch[1:] < 0.05) if a != b)
+    state = PinchState()
+    active = [state.update([d, 1, 1, 1])[0] == "draw" for d in pinch]
+    new = sum(1 for a, b in zip(active[:-1], active[1:]) if a != b)
+    return old, new
+
+
+def run_benchmark(path=None):
+    if path:
+        data = np.load(path)
+        lead = float(data["lead"])
+        t, role, lm = data["t"], data["role"], data["landmarks"]
+        cur = role == 0
+        tc, lc = t[cur], lm[cur]
+        seen = ((lc[:, 4, 0] + lc[:, 8, 0]) / 2, (lc[:, 4, 1] + lc[:, 8, 1]) / 2,
+                np.hypot(lc[:, 8, 0] - lc[:, 4, 0], lc[:, 8, 1] - lc[:, 4, 1]))
+        truth = None
+        lc = lm[role == 1]
+        pinch = np.hypot(lc[:, 8, 0] - lc[:, 4, 0], lc[:, 8, 1] - lc[:, 4, 1])
+        print(f"Trace {path}: {cur.sum()} cursor rows, {len(pinch)} controller rows")
+    else:
+        lead = 0.06  # what the controller would measure for this pipeline
+        tc, seen, truth, pinch = _synthetic_trace(latency=lead)
+        print(f"Synthetic trace: {len(tc)} frames @ 30 fps, 60 ms pipeline latency, 0.003 noise")
+
+    if len(tc) > 2:
+        f = CursorFilter()
+        out = np.array([f.update(x, y, w, ti, lead) for ti, x, y, w in zip(tc, *seen)]).T
+        filtered = (out[0], out[1])
+        raw = (seen[0], seen[1])
+
+        # Synthetic: jitter over the still-hand segment; recorded: over the whole trace
+        hold = tc < 5 if truth is not None else None
+        print(f"  {'':<22} {'jitter (px)':>12} {'lag (ms)':>10}")
+        ref = truth if truth is not None else raw
+        what = "end-to-end" if truth is not None else "vs raw"
+        for label, xy in (("raw (before)", raw), (f"filtered + {lead * 1000:.0f}ms lead", filtered)):
+            print(f"  {label:<22} {_jitter_px(xy, hold):12.2f} {_lag_s(tc, ref, xy) * 1000:10.0f}  ({what})")
+
+    if len(pinch) > 2:
+        old, new = _pinch_flicker(pinch)
+        print(f"  pinch transitions: {old} with the single threshold, {new} with hysteresis")
+
+
+if __name__ == "__main__":
+    run_benchmark(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -0,0 +1,220 @@
+import sys
+import time
+import gzip
+import queue
+import threading
+import numpy as np
+import pygame
+import cv2
+from conway_config import *
+
+# Output per session:
+#   <prefix>.mp4           the screen sampled on a wall-clock RECORD_FPS grid, encoded off the main loop.
+#                          Slots with no captured frame (slow loop, dropped frame) repeat the previous one,
+#                          so playback time always matches session time.
+#   <prefix>.events.txt.gz one line per generation: "<gen> <ms> +x,y,color ... -x,y ..."
+#                          (births with their color index, deaths; relative to the previous line,
+#                          so a generation lost to a full queue is folded into the next line).
+
+_STOP = None
+
+
+class SessionRecorder:
+    """
+    The main loop only copies pixels and live cells into bounded queues; a background
+    thread encodes and writes. When either queue is full, entries are dropped instead of blocking.
+    """
+
+    def __init__(self, prefix, size, fps=RECORD_FPS, every=RECORD_EVERY, queue_mb=RECORD_QUEUE_MB):
+        self.prefix = prefix
+        self.size = size
+        self.fps = fps
+        self.every = max(1, every)  # never capture more often than every Nth presented frame
+
+        self.writer = cv2.VideoWriter(f"{prefix}.mp4", cv2.VideoWriter_fourcc(*RECORD_FOURCC), fps, size)
+        if not self.writer.isOpened():
+            raise IOError(f"Could not open video writer for {prefix}.mp4")
+        self.log = gzip.open(f"{prefix}.events.txt.gz", "wt")
+
+        # Bounded by bytes: a full-screen RGBX copy is 8 MB at 1080p. Once the encoder is behind,
+        # a deeper queue does not help; the slot-repeat logic covers dropped frames.
+        w, h = size
+        self.frames = queue.Queue(maxsize=max(2, queue_mb * 1024 * 1024 // (w * h * 4)))
+        self.events = queue.Queue(maxsize=RECORD_EVENT_QUEUE_SIZE)
+        self.t0 = time.perf_counter()
+        self.next_due = self.t0
+        self.presented = 0
+        self.last_captured = -self.every
+        self.last_generation = None
+
+        # Worker thread only
+        self.prev_cells = {}
+        self.next_slot = 0
+        self.last_frame = None
+
+        # Stats
+        self.dropped = 0
+        self.events_dropped = 0
+        self.encoded = 0
+        self.repeated = 0
+        self.max_depth = 0
+
+        self.thread = threading.Thread(target=self._run, name="SessionRecorder", daemon=True)
+        self.thread.start()
+
+    def capture(self, params):
+        """Call once per presented frame, after drawing. Never blocks."""
+        now = time.perf_counter()
+        if params.generation != self.last_generation:
+            self.last_generation = params.generation
+            self._log_generation(params, now)
+
+        self.presented += 1
+        # Wall clock is the time base; --record-every only caps how often we pay for a copy
+        if now < self.next_due or self.presented - self.last_captured < self.every:
+            return
+        slot = int((now - self.t0) * self.fps)
+        self.next_due = self.t0 + (slot + 1) / self.fps
+        self.last_captured = self.presented
+
+        if self.frames.full():
+            self.dropped += 1
+            return
+        # One copy of the screen. 4-byte RGBX is a straight copy for 32-bit displays;
+        # packing to RGB is left to the encoder thread.
+        pixels = pygame.image.tobytes(params.screen, "RGBX")
+        try:
+            self.frames.put_nowait((slot, pixels))
+        except queue.Full:
+            self.dropped += 1
+        self.max_depth = max(self.max_depth, self.frames.qsize())
+
+    def _log_generation(self, params, now):
+        try:
+            self.events.put_nowait((params.generation, now - self.t0, params.live_cells.copy()))
+        except queue.Full:
+            # The next line simply diffs across the lost generations
+            self.events_dropped += 1
+
+    def hud_line(self):
+        line = f"REC: {self.encoded} enc | {self.dropped} drop | q {self.frames.qsize()}/{self.frames.maxsize}"
+        if self.events_dropped:
+            line += f" | ev drop {self.events_dropped}"
+        return (line, (255, 80, 80))
+
+    def _run(self):
+        w, h = self.size
+        while True:
+            # Time out so generation events are written even when no frame arrives
+            try:
+                item = self.frames.get(timeout=0.1)
+            except queue.Empty:
+                self._write_events()
+                continue
+            self._write_events()
+            if item is _STOP:
+                break
+            slot, pixels = item
+            frame = cv2.cvtColor(np.frombuffer(pixels, dtype=np.uint8).reshape(h, w, 4), cv2.COLOR_RGBA2BGR)
+            self._write_until(slot, frame)
+
+        # Hold the last frame until the moment recording stopped
+        if self.last_frame is not None:
+            self._write_until(int((time.perf_counter() - self.t0) * self.fps), self.last_frame)
+
+    def _write_until(self, slot, frame):
+        """Writes `frame` at `slot`, repeating the previous frame over any empty slots before it."""
+        filler = self.last_frame if self.last_frame is not None else frame
+        while self.next_slot < slot:
+            self.writer.write(filler)
+            self.next_slot += 1
+            self.repeated += 1
+        if self.next_slot == slot:
+            self.writer.write(frame)
+            self.next_slot += 1
+            self.encoded += 1
+        self.last_frame = frame
+
+    def _write_events(self):
+        while True:
+            try:
+                generation, t, cells = self.events.get_nowait()
+            except queue.Empty:
+                return
+            prev = self.prev_cells
+            fields = [str(generation), str(int(t * 1000))]
+            fields += [f"+{x},{y},{c}" for (x, y), c in cells.items() if (x, y) not in prev]
+            fields += [f"-{x},{y}" for (x, y) in prev if (x, y) not in cells]
+            self.log.write(" ".join(fields) + "\n")
+            self.prev_cells = cells
+
+    def close(self):
+        if self.thread is None:
+            return
+        self.frames.put(_STOP)  # blocking is fine on shutdown: flush what is queued
+        self.thread.join()
+        self.thread = None
+        self.writer.release()
+        self.log.close()
+        print(f"Recorded {self.next_slot / self.fps:.1f}s to {self.prefix}.mp4 ({self.encoded} frames, "
+              f"{self.repeated} repeated, {self.dropped} dropped, {self.events_dropped} events dropped)")
+
+
+# --- MAIN-LOOP IMPACT BENCHMARK ---
+# SDL_VIDEODRIVER=dummy python conway_recorder.py [seconds]
+# Runs the nocap simulate/render/HUD loop without and with the recorder, first uncapped
+# (raw cost) and then at the WORKING_FPS cap the game runs at. Also checks that the
+# video's duration matches the time it covered.
+
+def run_benchmark(seconds=5.0):
+    import os, tempfile
+    from conway_dataclass import Nocap_params
+    from conway_utils import update_game_logic, render_nocap, draw_hud
+
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH * PX_SIZE, HEIGHT * PX_SIZE))
+    out_dir = tempfile.mkdtemp(prefix="conway_rec_")
+    clock = pygame.time.Clock()
+
+    for cap in (0, WORKING_FPS):
+        print(f"{'uncapped' if not cap else f'capped at {cap} FPS'}:")
+        for label, every in (("no recorder", None), ("every frame", 1), ("every 2nd frame", 2), ("every 4th frame", 4)):
+            np.random.seed(0)
+            params = Nocap_params(screen=screen, working=True)
+            for x in range(WIDTH):
+                for y in range(HEIGHT):
+                    if np.random.random() < 0.3:
+                        params.live_cells[(x, y)] = np.random.randint(len(params.ALIVE_COLOR))
+            if every:
+                params.recorder = SessionRecorder(os.path.join(out_dir, f"cap{cap}_every{every}"), screen.get_size(), every=every)
+
+            frames = 0
+            capture_time = 0.0
+            start = time.perf_counter()
+            while time.perf_counter() - start < seconds:
+                update_game_logic(params)
+                render_nocap(params)
+                draw_hud(params, 0)
+                if params.recorder:
+                    t0 = time.perf_counter()
+                    params.recorder.capture(params)
+                    capture_time += time.perf_counter() - t0
+                pygame.display.update()
+                frames += 1
+                if cap:
+                    clock.tick(cap)
+            elapsed = time.perf_counter() - start
+
+            line = f"  {label:<16} {frames / elapsed:7.1f} FPS"
+            if params.recorder:
+                rec = params.recorder
+                rec.close()
+                line += (f" | capture {capture_time / frames * 1e6:6.0f} us/frame | {rec.encoded} captured"
+                         f" | {rec.dropped} dropped | video {rec.next_slot / rec.fps:4.1f}s for {elapsed:4.1f}s")
+            print(line)
+    print(f"Output in {out_dir}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    run_benchmark(float(sys.argv[1]) if len(sys.argv) > 1 else 5.0)
@@ -0,0 +1,51 @@
+import time
+import sys
+from contextlib import contextmanager
+
+# Import this first: the clock starts when this module is loaded.
+T0 = time.perf_counter()
+
+_last = T0
+STEPS = []  # (label, seconds)
+
+HEAVY_MODULES = ("cv2", "mediapipe", "pythonosc")
+
+
+def mark(label):
+    """Records the time spent since the previous mark."""
+    global _last
+    now = time.perf_counter()
+    STEPS.append((label, now - _last))
+    _last = now
+
+
+@contextmanager
+def timed(label):
+    """Records the time spent in the block (e.g. a lazy import) as its own step."""
+    mark("(other)")
+    yield
+    mark(label)
+
+
+def report(rss_mb, budget_s=None, budget_mb=None, forbidden=()):
+    """Prints the startup profile. Returns False if a budget or a forbidden import was hit."""
+    total = time.perf_counter() - T0
+    print("--- Startup profile ---")
+    for label, seconds in STEPS:
+        if label == "(other)" and seconds < 0.001:
+            continue
+        print(f"  {label:<36} {seconds * 1000:8.1f} ms")
+    print(f"  {'time to first frame':<36} {total * 1000:8.1f} ms")
+    print(f"  {'RSS at first frame':<36} {rss_mb:8.1f} MB")
+    loaded = [m for m in HEAVY_MODULES if m in sys.modules]
+    print(f"  heavy modules loaded: {', '.join(loaded) if loaded else 'none'}")
+
+    ok = True
+    if budget_s is not None and total > budget_s:
+        print(f"  OVER BUDGET: {total:.2f}s > {budget_s:.2f}s"); ok = False
+    if budget_mb is not None and rss_mb > budget_mb:
+        print(f"  OVER BUDGET: {rss_mb:.0f} MB > {budget_mb:.0f} MB"); ok = False
+    for m in forbidden:
+        if m in sys.modules:
+            print(f"  UNEXPECTED IMPORT: {m}"); ok = False
+    return ok
@@ -3,7 +3,6 @@ from pygame import surfarray
 import numpy as np
 from collections import Counter
 from conway_dataclass import *
-import mediapipe as mp
 import os
 import psutil
 from conway_sound import process_sound
@@ -59,6 +58,7 @@ def update_game_logic(params):
     # 3. Apply Update
     params.live_cells = next_generation
     params.cell_stability = next_stability
+    params.generation += 1
 
 def update_sound_probe(params):
     """
@@ -91,6 +91,23 @@ def update_sound_probe(params):
     process_sound(params)
 
 
+def parse_size(text):
+    """'1280x720' -> (1280, 720), for argparse."""
+    w, h = text.lower().split("x")
+    return int(w), int(h)
+
+
+def make_grid_surface(params: Withcap_params):
+    grid_surface = pygame.Surface((params.WIDTH*params.PX_SIZE, params.HEIGHT*params.PX_SIZE), pygame.SRCALPHA)
+    # Use a slightly transparent color for grid lines
+    grid_color = (params.BASE_COLOR[0], params.BASE_COLOR[1], params.BASE_COLOR[2], 100)
+    for x in range(0, params.WIDTH):
+        pygame.draw.line(grid_surface, grid_color, (x*params.PX_SIZE, 0), (x*params.PX_SIZE, params.HEIGHT * params.PX_SIZE))
+    for y in range(0, params.HEIGHT):
+        pygame.draw.line(grid_surface, grid_color, (0, y*params.PX_SIZE), (params.WIDTH * params.PX_SIZE, y*params.PX_SIZE))
+    return grid_surface
+
+
 def render_nocap(params: Nocap_params):
     # ... (Same as before) ...
     if params.force_full_redraw:
@@ -119,11 +136,8 @@ def render_nocap(params: Nocap_params):
     params.prev_live_cells = params.live_cells.copy()
 
 
-def render_withcap(params: Withcap_params):
-    # ... (Same as before) ...
-    if params.frame_with_lm_drawn is None:
-        return
-
+def make_webcam_surface(params: Withcap_params):
+    import cv2 # already loaded by the webcam setup; kept local so nocap never imports it
     frame = params.frame_with_lm_drawn
     img_height, img_width = frame.shape[0], frame.shape[1]
     screen_width, screen_height = params.screen.get_size()
@@ -148,10 +162,23 @@ def render_withcap(params: Withcap_params):
     frame_rgb = np.transpose(frame_rgb, (1, 0, 2))
 
     wbcm = surfarray.make_surface(frame_rgb)
-    webcam_surface = pygame.transform.smoothscale(wbcm, (scaled_width, scaled_height))
+    if params.quality.smoothscale:
+        webcam_surface = pygame.transform.smoothscale(wbcm, (scaled_width, scaled_height))
+    else:
+        webcam_surface = pygame.transform.scale(wbcm, (scaled_width, scaled_height))
+    return webcam_surface, (blit_x, blit_y)
+
+
+def render_withcap(params: Withcap_params):
+    if params.frame_with_lm_drawn is None:
+        return
+
+    # Rebuilding the webcam layer (convert + scale) is the expensive part: the governor may reuse it
+    if params.webcam_surface is None or params.frame_index % params.quality.webcam_every == 0:
+        params.webcam_surface, params.webcam_blit_pos = make_webcam_surface(params)
 
     # 4. Blit Webcam
-    params.screen.blit(webcam_surface, (blit_x, blit_y))
+    params.screen.blit(params.webcam_surface, params.webcam_blit_pos)
 
     # --- NEW: DIMMER LAYER ---
     # Create a black surface with Alpha (Transparency)
@@ -185,8 +212,18 @@ def render_withcap(params: Withcap_params):
 
 
 def draw_hud(params, fps: float):
-    # ... (Same as before) ...
     screen = params.screen
+    # Text rendering is cached; the governor may refresh it only every Nth frame
+    if params.hud_panel is None or params.frame_index % params.quality.hud_every == 0:
+        params.hud_panel = make_hud_panel(params, fps)
+    screen.blit(params.hud_panel, (10, 10))
+
+    if params.hud_help is None:
+        params.hud_help = make_help_strip(params)
+    screen.blit(params.hud_help, (0, params.HEIGHT * params.PX_SIZE - 25))
+
+
+def make_hud_panel(params, fps: float):
     mem_info = PROCESS.memory_info()
     mem_usage_mb = mem_info.rss / 1024 / 1024
     num_cells = len(params.live_cells)
@@ -201,33 +238,41 @@ def draw_hud(params, fps: float):
         lines.append(("STATE: PAUSED", (255, 50, 50)))
 
     if isinstance(params, Withcap_params):
-        lines.append((f"Cursor Size: {params.cursor_size}", (255, 255, 0)))
+        lines.append((f"Cursor Size: {params.cursor_size} | Lead: {params.hand_latency_ms:.0f} ms", (255, 255, 0)))
         if params.hand_drawing:
             lines.append(("[ DRAWING ]", (0, 255, 0)))
         elif params.hand_erasing:
             lines.append(("[ ERASING ]", (255, 0, 0)))
         else:
             lines.append(("[ HOVERING ]", (200, 200, 200)))
+        if params.governor:
+            lines.append(params.governor.hud_line())
+
+    if params.recorder:
+        lines.append(params.recorder.hud_line())
 
-    panel_width = 280
+    text_surfs = [FONT_MAIN.render(text_str, True, color) for text_str, color in lines]
+    # Grow past the usual width rather than clip a long line
+    panel_width = max(280, max(surf.get_width() for surf in text_surfs) + 20)
     panel_height = 10 + (len(lines) * 20)
     panel = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
     panel.fill((0, 0, 0, 180))
     pygame.draw.rect(panel, (100, 100, 100), panel.get_rect(), 1)
-    screen.blit(panel, (10, 10))
 
-    x_offset = 20; y_offset = 15
-    for text_str, color in lines:
-        text_surf = FONT_MAIN.render(text_str, True, color)
-        screen.blit(text_surf, (x_offset, y_offset))
+    x_offset = 10; y_offset = 5
+    for text_surf in text_surfs:
+        panel.blit(text_surf, (x_offset, y_offset))
         y_offset += 20
+    return panel
+
 
+def make_help_strip(params):
     help_text = "L-Hand: Pinch Index(Draw) Middle(Erase) Ring(Rnd) Pinky(Clr) | R-Hand: Pinch to Resize"
     help_surf = FONT_SMALL.render(help_text, True, (200, 200, 200))
-    bottom_strip = pygame.Surface((params.WIDTH * params.PX_SIZE, 25), pygame.SRCALPHA)
-    bottom_strip.fill((0, 0, 0, 150))
-    screen.blit(bottom_strip, (0, params.HEIGHT * params.PX_SIZE - 25))
-    
     screen_w = params.WIDTH * params.PX_SIZE
+    bottom_strip = pygame.Surface((screen_w, 25), pygame.SRCALPHA)
+    bottom_strip.fill((0, 0, 0, 150))
+
     text_w = help_surf.get_width()
-    screen.blit(help_surf, ((screen_w - text_w) // 2, params.HEIGHT * params.PX_SIZE - 22))
+    bottom_strip.blit(help_surf, ((screen_w - text_w) // 2, 3))
+    return bottom_strip
@@ -0,0 +1,98 @@
+import pygame
+import signal, sys
+import argparse
+from conway_config import *
+from conway_dataclass import *
+from conway_utils import *
+from conway_broadcast import BoardSubscriber
+
+# Renders a board published by `conway_main.py -s`. Run one per display:
+#   python conway_main.py -w -s          (simulation + hand input)
+#   python conway_viewer.py -f           (plain board)
+#   python conway_viewer.py -f -w        (webcam composite)
+
+def graceful_shutdown(sig, frame):
+    pygame.quit(); sys.exit(0)
+
+def main():
+    signal.signal(signal.SIGINT, graceful_shutdown)
+
+    parser = argparse.ArgumentParser(description="Conway's Game of Life - viewer")
+    parser.add_argument('name', nargs='?', default=BROADCAST_NAME, help='Shared memory name of the board server')
+    parser.add_argument('-f', '--fullscreen', action='store_true', help='Run in full-screen mode')
+    parser.add_argument('-w', '--webcam', action='store_true', help='Use webcam as background')
+    parser.add_argument('--source', default=None, metavar='SPEC',
+                        help='Frame source for -w (implies -w): camera index, video file, image glob/dir or "synthetic"')
+    parser.add_argument('--cam-size', type=parse_size, default=CAM_SIZE, metavar='WxH', help='Requested capture resolution')
+    parser.add_argument('--cam-fps', type=float, default=CAM_FPS, help='Requested capture frame rate (0 = source default)')
+    parser.add_argument('--fps', type=int, default=DRAWING_FPS, help='Render rate of this viewer')
+    args = parser.parse_args()
+    if args.source is not None:
+        args.webcam = True
+
+    board = BoardSubscriber(args.name)
+    print(f"Attached to '{args.name}' ({board.width}x{board.height})")
+
+    pygame.init()
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+    pygame.display.set_caption(f"Conway's Game of Life - {args.name}")
+    clock = pygame.time.Clock()
+
+    if args.webcam:
+        import cv2
+        render = render_withcap
+        params = Withcap_params()
+        from conway_framesource import open_source
+        params.cap = open_source(args.source or WEBCAM_INDEX, args.cam_size, args.cam_fps)
+        if not params.cap.isOpened():
+            print("Error: Could not open webcam.")
+            sys.exit(1)
+        print(f"Frame source: {params.cap.describe()}")
+    else:
+        render = render_nocap
+        params = Nocap_params()
+
+    # The board size is fixed by the server; SCALED stretches it to the display
+    params.WIDTH = board.width
+    params.HEIGHT = board.height
+    size = (params.WIDTH * PX_SIZE, params.HEIGHT * PX_SIZE)
+    if args.fullscreen:
+        params.screen = pygame.display.set_mode(size, pygame.FULLSCREEN | pygame.SCALED)
+    else:
+        params.screen = pygame.display.set_mode(size)
+
+    if args.webcam:
+        params.grid_surface = make_grid_surface(params)
+    else:
+        params.screen.fill(BASE_COLOR)
+
+    while True:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                graceful_shutdown(None, None)
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_q:
+                graceful_shutdown(None, None)
+
+        if board.closed:
+            print("Board server closed.")
+            graceful_shutdown(None, None)
+
+        if isinstance(params, Withcap_params):
+            ret, frame = params.cap.read()
+            if ret:
+                params.frame_with_lm_drawn = cv2.flip(frame, 1)
+
+        # Catch up on everything published since the last frame
+        if board.poll():
+            params.live_cells = board.live_cells()
+            params.cell_stability = board.cell_stability()
+            params.generation = board.generation
+        params.working = board.working
+
+        render(params)
+        draw_hud(params, clock.get_fps())
+        pygame.display.update()
+        clock.tick(args.fps)
+
+if __name__ == "__main__":
+    main()